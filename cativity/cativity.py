@@ -20,7 +20,30 @@ from modules.graphs import Graphs
 from modules.network import Network
 
 CHANNEL_HOPPING_INTERVAL = 3.5
+PACKET_WAIT_TIMEOUT = 1
 SCRIPT_NAME = os.path.basename(sys.argv[0])
+BANNER = "\n".join(
+    [
+        typer.style(
+            """
+  ____      _   _       _ _         ____       _            _
+ / ___|__ _| |_(_)_   _(_) |_ _   _|  _ \  ___| |_ ___  ___| |_ ___  _ __
+| |   / _` | __| \ \ / / | __| | | | | | |/ _ \ __/ _ \/ __| __/ _ \| '__|
+| |__| (_| | |_| |\ V /| | |_| |_| | |_| |  __/ ||  __/ (__| || (_) | |
+ \____\__,_|\__|_| \_/ |_|\__|\__, |____/ \___|\__\___|\___|\__\___/|_|
+                              |___/
+""",
+            fg=typer.colors.BRIGHT_YELLOW,
+        ),
+        typer.style(
+            "A tool to analyze the channel activity fro Zigbee Networks",
+            fg=typer.colors.BRIGHT_CYAN,
+        ),
+        typer.style("Author: astrobyte", fg=typer.colors.BRIGHT_CYAN),
+        typer.style("Version: 1.0", fg=typer.colors.BRIGHT_CYAN),
+        "\n",
+    ]
+)
 
 logging.basicConfig(
     handlers=[logging.FileHandler("cativity.log"), logging.StreamHandler()],
@@ -47,6 +70,8 @@ class Cativity:
         self.network = Network()
         self.capture_started = True
         self.packet_received = queue.Queue()
+        # Set by the receiver on every queued packet, see channel_handler
+        self.packet_event = threading.Event()
         self.channel_activity = {}
         self.fixed_channel = False
         self.__init_channel_map()
@@ -56,28 +81,16 @@ class Cativity:
             self.channel_activity[channel] = 0
 
     def __print_banner(self):
-        typer.secho(
-            """
-  ____      _   _       _ _         ____       _            _
- / ___|__ _| |_(_)_   _(_) |_ _   _|  _ \  ___| |_ ___  ___| |_ ___  _ __
-| |   / _` | __| \ \ / / | __| | | | | | |/ _ \ __/ _ \/ __| __/ _ \| '__|
-| |__| (_| | |_| |\ V /| | |_| |_| | |_| |  __/ ||  __/ (__| || (_) | |
- \____\__,_|\__|_| \_/ |_|\__|\__, |____/ \___|\__\___|\___|\__\___/|_|
-                              |___/
-""",
-            fg=typer.colors.BRIGHT_YELLOW,
-        )
-        typer.secho(
-            "A tool to analyze the channel activity fro Zigbee Networks",
-            fg=typer.colors.BRIGHT_CYAN,
-        )
-        typer.secho("Author: astrobyte", fg=typer.colors.BRIGHT_CYAN)
-        typer.secho("Version: 1.0", fg=typer.colors.BRIGHT_CYAN)
-        typer.secho("\n")
+        typer.echo(BANNER)
 
     def channel_handler(self):
         while self.capture_started:
             if self.fixed_channel:
+                # Sleep until the receiver queues a packet instead of spinning
+                # on the queue length, the timeout lets the loop see a stop
+                if not self.packet_event.wait(PACKET_WAIT_TIMEOUT):
+                    continue
+                self.packet_event.clear()
                 if len(self.packet_received.queue) > 0:
                     self.channel_activity[self.catsniffer.channel] = len(
                         self.packet_received.queue
@@ -159,6 +172,7 @@ class Cativity:
                 if tisniffer_packet.is_command_response():
                     continue
                 self.packet_received.put(tisniffer_packet.payload)
+                self.packet_event.set()
                 if topology:
                     dissected_packet = self.network.dissect_packet(
                         tisniffer_packet.payload
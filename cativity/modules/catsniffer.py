@@ -8,9 +8,18 @@ from .hardware import Board
 CATSNIFFER_VID = 11914
 CATSNIFFER_PID = 192
 SNIFFER_CHANNELS = range(11, 27)
+SNIFFER_CHANNEL_FREQUENCIES = {
+    channel: 2405 + (channel - 11) * 5 for channel in SNIFFER_CHANNELS
+}
 SNIFFER_DEF_CHANNEL = 11
 START_OF_FRAME = b"\x40\x53"
 END_OF_FRAME = b"\x40\x45"
+FRAME_DELIMITER = END_OF_FRAME + START_OF_FRAME
+# Precompiled layouts: start of frame, command and data length of a command,
+# start of frame, packet info and length of a received packet, end of frame
+COMMAND_HEADER = struct.Struct("<2scH")
+PACKET_HEADER = struct.Struct("<HBH")
+PACKET_END = struct.Struct("<H")
 
 if platform.system() == "Windows":
     DEFAULT_COMPORT = "COM1"
@@ -37,28 +46,29 @@ class TISnifferPacket:
 
     class PacketCommand:
         def __init__(self, cmd, data=b""):
+            if isinstance(cmd, int):
+                cmd = cmd.to_bytes(1, byteorder="little")
             self.cmd = cmd
             self.data = data
             self.packet = self.__pack()
 
         def calculate_fcs(self):
-            if type(self.cmd) == int:
-                self.cmd = self.cmd.to_bytes(1, byteorder="little")
-            core_bytes = sum(self.cmd + len(self.data).to_bytes(2, byteorder="little"))
-            if self.data != b"":
-                core_bytes += sum(self.data)
+            # The length counts as its low plus high byte, no need to pack it
+            data_length = len(self.data)
+            core_bytes = (
+                sum(self.cmd)
+                + (data_length & 0xFF)
+                + (data_length >> 8)
+                + sum(self.data)
+            )
 
             checksum = core_bytes & 0xFF
             return checksum.to_bytes(1, byteorder="little")
 
         def __pack(self):
-            if type(self.cmd) == int:
-                self.cmd = self.cmd.to_bytes(1, byteorder="little")
             return b"".join(
                 [
-                    START_OF_FRAME,
-                    self.cmd,
-                    len(self.data).to_bytes(2, byteorder="little"),
+                    COMMAND_HEADER.pack(START_OF_FRAME, self.cmd, len(self.data)),
                     self.data,
                     self.calculate_fcs(),
                     END_OF_FRAME,
@@ -102,8 +112,8 @@ class TISnifferPacket:
 
     def __unpack(self):
         try:
-            (self.sof, self.info, self.p_len) = struct.unpack_from(
-                "<HBH", self.packet_bytes
+            (self.sof, self.info, self.p_len) = PACKET_HEADER.unpack_from(
+                self.packet_bytes
             )
             self.payload = self.packet_bytes[5:-2]
             if len(self.payload) > 7:
@@ -116,7 +126,7 @@ class TISnifferPacket:
                 # print(self.packet_bytes.hex())
                 # print("="*20)
                 self.payload = self.payload[7:-2]
-            self.eof = struct.unpack_from("<H", self.packet_bytes[-2:])
+            self.eof = PACKET_END.unpack_from(self.packet_bytes, -2)
         except struct.error as e:
             self.logger.error("Error unpacking packet: %s", e)
             raise e
@@ -126,6 +136,21 @@ class TISnifferPacket:
         return self.payload.hex()
 
 
+# Commands that never change, packed once
+PING_PACKET = TISnifferPacket.PacketCommand(
+    TISnifferPacket.Commands.CMD_PING.value
+).packet
+START_PACKET = TISnifferPacket.PacketCommand(
+    TISnifferPacket.Commands.CMD_START.value
+).packet
+STOP_PACKET = TISnifferPacket.PacketCommand(
+    TISnifferPacket.Commands.CMD_STOP.value
+).packet
+CFG_PHY_PACKET = TISnifferPacket.PacketCommand(
+    TISnifferPacket.Commands.CMD_CFG_PHY.value, b"\x12"
+).packet
+
+
 class Sniffer(Board):
     CONST_FRECUENCY = 65536  # 2^16 -> 16 bits -> MHz
 
@@ -135,6 +160,8 @@ class Sniffer(Board):
         self.channel = channel
         self.channel_range = SNIFFER_CHANNELS
         self.frequency = 2405
+        # Frequency command packets, by frequency
+        self.frequency_commands = {}
         self.logger = logger if logger else TrivialLogger()
 
     def __str__(self):
@@ -147,13 +174,13 @@ class Sniffer(Board):
             self.open()
 
         try:
-            bytestream = self.serial_worker.read_until((END_OF_FRAME + START_OF_FRAME))
-            sof_idx = 0
-            eof_idx = bytestream.find((END_OF_FRAME + START_OF_FRAME), sof_idx)
-            if eof_idx == -1:
-                self.logger.error(f"Invalid frame received: {bytestream}")
+            bytestream = self.serial_worker.read_until(FRAME_DELIMITER)
+            # read_until stops right after the delimiter, so a complete frame
+            # always ends with it; anything else is a timeout
+            if not bytestream.endswith(FRAME_DELIMITER):
+                self.logger.error("Invalid frame received: %s", bytestream)
                 return None
-            bytestream = START_OF_FRAME + bytestream[sof_idx : eof_idx + 2]
+            bytestream = START_OF_FRAME + bytestream[:-2]
             return bytestream
         except serial.SerialException as e:
             self.logger.error("Error reading from serial port: %s", e)
@@ -162,7 +189,7 @@ class Sniffer(Board):
     def set_channel(self, channel):
         if channel in self.channel_range:
             self.channel = channel
-            self.frequency = 2405 + (self.channel - 11) * 5
+            self.frequency = SNIFFER_CHANNEL_FREQUENCIES[channel]
         else:
             self.logger.error("Invalid channel: %d", channel)
             raise ValueError("Invalid channel")
@@ -183,6 +210,16 @@ class Sniffer(Board):
     def get_frequency(self):
         return self.__calculate_frequency(self.frequency)
 
+    def get_frequency_command(self) -> bytes:
+        # Hopping revisits the same few channels, pack each command once
+        frequency_command = self.frequency_commands.get(self.frequency)
+        if frequency_command is None:
+            frequency_command = TISnifferPacket.PacketCommand(
+                TISnifferPacket.Commands.CMD_CFG_FREQUENCY.value, self.get_frequency()
+            ).packet
+            self.frequency_commands[self.frequency] = frequency_command
+        return frequency_command
+
     @staticmethod
     def find_catsniffer_serial_port():
         ports = serial.tools.list_ports.comports()
@@ -191,67 +228,24 @@ class Sniffer(Board):
                 return port.device
         return DEFAULT_COMPORT
 
-    def __str__(self):
-        return "Sniffer(catsniffer={}, channel={}, frequency={})".format(
-            self.catsniffer, self.channel, self.frequency
-        )
+    def get_config_commands(self) -> list:
+        return [
+            STOP_PACKET,
+            CFG_PHY_PACKET,
+            self.get_frequency_command(),
+            START_PACKET,
+        ]
 
     def change_channel(self, channel):
         self.set_channel(channel)
-        self.catsniffer.write(
-            TISnifferPacket.PacketCommand(
-                TISnifferPacket.Commands.CMD_STOP.value
-            ).packet
-        )
-        self.catsniffer.write(
-            TISnifferPacket.PacketCommand(
-                TISnifferPacket.Commands.CMD_CFG_PHY.value, b"\x12"
-            ).packet
-        )
-        self.catsniffer.write(
-            TISnifferPacket.PacketCommand(
-                TISnifferPacket.Commands.CMD_CFG_FREQUENCY.value, self.get_frequency()
-            ).packet
-        )
-        self.catsniffer.write(
-            TISnifferPacket.PacketCommand(
-                TISnifferPacket.Commands.CMD_START.value
-            ).packet
-        )
+        # Send the whole command sequence in a single serial write
+        self.catsniffer.write(b"".join(self.get_config_commands()))
 
     def start_sniffer(self):
         self.catsniffer.open()
-        self.catsniffer.write(
-            TISnifferPacket.PacketCommand(
-                TISnifferPacket.Commands.CMD_PING.value
-            ).packet
-        )
-        self.catsniffer.write(
-            TISnifferPacket.PacketCommand(
-                TISnifferPacket.Commands.CMD_STOP.value
-            ).packet
-        )
-        self.catsniffer.write(
-            TISnifferPacket.PacketCommand(
-                TISnifferPacket.Commands.CMD_CFG_PHY.value, b"\x12"
-            ).packet
-        )
-        self.catsniffer.write(
-            TISnifferPacket.PacketCommand(
-                TISnifferPacket.Commands.CMD_CFG_FREQUENCY.value, self.get_frequency()
-            ).packet
-        )
-        self.catsniffer.write(
-            TISnifferPacket.PacketCommand(
-                TISnifferPacket.Commands.CMD_START.value
-            ).packet
-        )
+        self.catsniffer.write(b"".join([PING_PACKET, *self.get_config_commands()]))
         self.logger.info("Sniffer started")
 
     def stop_sniffer(self):
-        self.catsniffer.write(
-            TISnifferPacket.PacketCommand(
-                TISnifferPacket.Commands.CMD_STOP.value
-            ).packet
-        )
+        self.catsniffer.write(STOP_PACKET)
         self.logger.info("Sniffer stopped")
@@ -8,6 +8,7 @@ import requests
 import io
 import serial
 import time
+from functools import lru_cache
 from serial.tools.list_ports import comports
 from rich.console import Console
 from rich.table import Table
@@ -28,6 +29,7 @@ GITHUB_RELEASE_URL_SNIFFLE = (
     "https://api.github.com/repos/nccgroup/Sniffle/releases/latest"
 )
 GITHUB_SNIFFLE_HEX = "sniffle_cc1352p7_1M"
+FIRMWARE_EXTENSION = ".hex"
 DESCRIPTION_FILE = "descriptions.txt"
 COMMAND_ENTER_BOOTLOADER = "ñÿ<boot>ÿñ"
 COMMAND_EXIT_BOOTLOADER = "ñÿ<exit>ÿñ"
@@ -37,26 +39,33 @@ CATSNIFFER_VID = 11914
 CATSNIFFER_PID = 192
 TIMEOUT_FETCH = 5
 ABS_FILE_PATH = os.path.dirname(os.path.abspath(__file__))
+# Log prefixes
+LOG_PREFIX_INFO = "[INFO] "
+LOG_PREFIX_ERROR = "\x1b[31;1m[ERROR] "
+LOG_PREFIX_WARNING = "\x1b[33;1m[WARNING] "
+LOG_PREFIX_SUCCESS = "\x1b[32;1m[SUCCESS] "
+LOG_STYLE_RESET = "\x1b[0m"
+CONSOLE = Console()
 
 
 def LOG_INFO(message):
     """Function to log information."""
-    print(f"[INFO] {message}")
+    print(f"{LOG_PREFIX_INFO}{message}")
 
 
 def LOG_ERROR(message):
     """Function to log error."""
-    print(f"\x1b[31;1m[ERROR] {message}\x1b[0m")
+    print(f"{LOG_PREFIX_ERROR}{message}{LOG_STYLE_RESET}")
 
 
 def LOG_WARNING(message):
     """Function to log warning."""
-    print(f"\x1b[33;1m[WARNING] {message}\x1b[0m")
+    print(f"{LOG_PREFIX_WARNING}{message}{LOG_STYLE_RESET}")
 
 
 def LOG_SUCCESS(message):
     """Function to log success."""
-    print(f"\x1b[32;1m[SUCCESS] {message}\x1b[0m")
+    print(f"{LOG_PREFIX_SUCCESS}{message}{LOG_STYLE_RESET}")
 
 
 app = typer.Typer(
@@ -85,7 +94,7 @@ class Release:
             return os.path.abspath(firmware)
 
         for release in self.releases:
-            if release.startswith(firmware) or firmware in release:
+            if firmware in release:
                 return os.path.join(
                     ABS_FILE_PATH, f"{RELEASE_FOLDER_NAME}{self.tag_version}/{release}"
                 )
@@ -109,15 +118,16 @@ class Release:
         dir_files = os.listdir(ABS_FILE_PATH)
         for dir_name in dir_files:
             if dir_name.startswith(RELEASE_FOLDER_NAME):
-                if self.__is_valid_release_content():
-                    self.tag_version = dir_name.replace(RELEASE_FOLDER_NAME, "")
-                    files = os.listdir(os.path.join(ABS_FILE_PATH, dir_name))
-                    filtered_files = [
-                        file for file in files if file != DESCRIPTION_FILE
-                    ]
-                    return filtered_files
-                else:
-                    return None
+                release_folder = os.path.join(ABS_FILE_PATH, dir_name)
+                files = os.listdir(release_folder)
+                if len(files) == 0:
+                    # Drop the incomplete release and try the next candidate
+                    LOG_WARNING("Empty release folder.")
+                    self.__remove_local_files_releases(release_folder)
+                    continue
+                self.tag_version = dir_name.replace(RELEASE_FOLDER_NAME, "")
+                filtered_files = [file for file in files if file != DESCRIPTION_FILE]
+                return filtered_files
         return None
 
     def __is_valid_release_content(self) -> bool:
@@ -213,12 +223,12 @@ class Release:
             content_bytes.close()
 
     def __dissect_firmware(self, asset):
-        if asset["name"].endswith(".hex"):
-            if "sniffle" in asset["name"]:
-                if GITHUB_SNIFFLE_HEX in asset["name"]:
-                    return asset
-            else:
-                return asset
+        # Any .hex asset, except Sniffle builds other than GITHUB_SNIFFLE_HEX
+        name = asset["name"]
+        if name.endswith(FIRMWARE_EXTENSION) and (
+            "sniffle" not in name or GITHUB_SNIFFLE_HEX in name
+        ):
+            return asset
         return None
 
     def download_remote_release(self):
@@ -257,9 +267,10 @@ class Release:
         return None
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def normalize_firmware_name(name):
         name = name.lower()
-        name = name.split("_v")[0]
+        name = name.partition("_v")[0]
         return name
 
     def get_descriptions_file(self):
@@ -289,7 +300,8 @@ class BoardUart:
         self.serial_worker.port = serial_port
         self.serial_worker.baudrate = 921600
         self.firmware_selected = 0
-        self.command_to_send = f"-e -w -v -p {self.serial_worker.port}"
+        # Flasher arguments as a list, so a port path with spaces stays whole
+        self.command_to_send = ["-e", "-w", "-v", "-p", self.serial_worker.port]
         self.python_command = self.validate_python_call()
 
     def validate_connection(self):
@@ -313,15 +325,19 @@ class BoardUart:
     def send_firmware(self, firmware_path):
         self.send_connect_boot()
         time.sleep(1)
-        # TODO: Add a check to see if the command was successful
         # Get path to python script
         script_path = os.path.join(ABS_FILE_PATH, UPLOADER_FILE_NAME)
-        os.system(
-            f"{self.python_command} {script_path} {self.command_to_send} {firmware_path}"
+        result = subprocess.run(
+            [
+                self.python_command or sys.executable,
+                script_path,
+                *self.command_to_send,
+                firmware_path,
+            ]
         )
         time.sleep(1)
         self.send_disconnect_boot()
-        return True
+        return result.returncode == 0
 
     def validate_python_call(self):
         try:
@@ -400,27 +416,32 @@ class CatnipUploader:
         LOG_SUCCESS(f"Loading firmware: {validate_firmware}")
         if board_uart.send_firmware(validate_firmware.replace("\r", "")):
             LOG_SUCCESS("Firmware loaded successfully.")
+        else:
+            LOG_ERROR("Error: Could not load the firmware.")
+            sys.exit(1)
 
     def get_firmwares(self):
         """Get the latest firmware releases."""
         table = Table(title="Releases")
-        table.add_column("Firmware")
-        table.add_column("Description")
+        table.add_column("Firmware", no_wrap=True)
+        table.add_column("Description", no_wrap=True, overflow="ellipsis")
+        rows = []
         try:
             description = self.releases.parse_descriptions()
             if description:
-                for key, value in description.items():
-                    table.add_row(key, value)
+                rows = list(description.items())
             else:
                 LOG_WARNING("No descriptions file found.")
         except FileNotFoundError:
             LOG_ERROR("No descriptions file found.")
-            releases = self.releases.get_releases()
-            for release in releases:
-                table.add_row(release, "No description available.")
+            rows = [
+                (release, "No description available.")
+                for release in self.releases.get_releases()
+            ]
         finally:
-            console = Console()
-            console.print(table)
+            for row in rows:
+                table.add_row(*row)
+            CONSOLE.print(table)
 
 
 def main():
@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
 # Frame
@@ -18,7 +19,6 @@ PCAP_VERSION_MINOR = 4
 PCAP_MAX_PACKET_SIZE = 0x0000FFFF
 DEFAULT_INIT_ADDRESS = "00:00:00:00:00:00"
 
-VERSION_NUMBER = "1"
 DEFAULT_TIMEOUT_JOIN = 1
 
 # FileNames
@@ -30,13 +30,15 @@ DEFAULT_HEX_PATH = "hexdumps"
 class BaseEnum(Enum):
     @classmethod
     def has_value(cls, value) -> bool:
-        return any(value == item.value for item in cls)
+        return cls.get_name(value) is not None
 
     @classmethod
     def get_name(cls, value) -> Optional[str]:
-        if cls.has_value(value):
+        # Enum lookup by value is a dict hit, no need to walk the members
+        try:
             return cls(value).name
-        return None
+        except ValueError:
+            return None
 
     @classmethod
     def get_value(cls, name) -> Optional[int]:
@@ -44,14 +46,20 @@ class BaseEnum(Enum):
             return cls[name].value
         return None
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def members(cls) -> tuple:
+        # Members never change after the class is built, index them once
+        return tuple(cls)
+
     @classmethod
     def list_names(cls) -> list:
-        return [(index, item) for index, item in enumerate(cls)]
+        return list(enumerate(cls.members()))
 
     @classmethod
     def get_by_index(cls, index) -> Optional[str]:
         if index < len(cls):
-            return cls.list_names()[index][1]
+            return cls.members()[index]
         return None
 
     def __str__(self):
@@ -79,6 +87,8 @@ class SnifferBoards(BaseEnum):
 class PacketCommand:
     def __init__(self, packet_info, payload=b""):
         self.start_of_frame = START_OF_FRAME
+        if isinstance(packet_info, int):
+            packet_info = packet_info.to_bytes(1, byteorder="little")
         self.packet_info = packet_info
         self.packet_length = len(payload).to_bytes(2, byteorder="little")
         self.packet_payload = payload
@@ -99,13 +109,12 @@ class PacketCommand:
         )
 
     def get_frame_check_sequence(self) -> bytes:
-        if type(self.packet_info) == int:
-            self.packet_info = self.packet_info.to_bytes(1, byteorder="little")
         # Add all the bytes from:
         # packet_info + packet_length + packet_payload
-        sum_core_bytes = sum(self.packet_info + self.packet_length)
-        if self.packet_payload != b"":
-            sum_core_bytes += sum(self.packet_payload)
+        # summed part by part, without concatenating them first
+        sum_core_bytes = (
+            sum(self.packet_info) + sum(self.packet_length) + sum(self.packet_payload)
+        )
         # and calculate the checksum
         # The checksum is the last byte of the packet
         # checksum = sum(packet_info + packet_length + packet_payload + 0xFF) & 0xFF
@@ -113,10 +122,11 @@ class PacketCommand:
         return checksum.to_bytes(1, byteorder="little")
 
     def set_packet_info(self, packet_category, packet_type) -> None:
-        self.packet_info = (packet_category << 6) | (packet_type & 0b00111111)
+        packet_info = (packet_category << 6) | (packet_type & 0b00111111)
+        self.packet_info = packet_info.to_bytes(1, byteorder="little")
 
     def to_hex(self) -> str:
-        return " ".join("{:02x}".format(byte) for byte in self.raw_packet)
+        return self.raw_packet.hex(" ")
 
     def __str__(self) -> str:
         return f"{self.raw_packet}"
@@ -1,7 +1,7 @@
-import platform
 import threading
 import time
 import os
+import errno
 import logging
 import sys
 import typer
@@ -10,17 +10,24 @@ from . import Pcap
 from .Definitions import LINKTYPE_IEEE802_15_4_NOFCS, DEFAULT_TIMEOUT_JOIN
 
 JOIN_TIMEOUT = 1
+FIFO_OPEN_POLL_INTERVAL = 0.1  # Seconds
 
-if platform.system() == "Windows":
+DEFAULT_FILENAME = "fcatsniffer"
+
+# pywin32 is only needed by FifoWindows, see load_pywin32
+win32pipe = win32file = pywintypes = None
+
+
+def load_pywin32():
+    global win32pipe, win32file, pywintypes
+    if pywintypes is not None:
+        return
     try:
         import win32pipe, win32file, pywintypes
-    except ImportError:
-        print(
-            "\x1b[33;1mError: win32pipe, win32file, pywintypes modules not found. Please install pywin32 package.\x1b[0m"
-        )
-        exit(1)
-
-DEFAULT_FILENAME = "fcatsniffer"
+    except ImportError as e:
+        raise ImportError(
+            "win32pipe, win32file, pywintypes modules not found. Please install pywin32 package."
+        ) from e
 
 
 class Fifo(threading.Thread):
@@ -55,17 +62,46 @@ class FifoLinux(Fifo):
     def create(self):
         try:
             os.mkfifo(self.fifo_path)
+        except FileExistsError:
+            pass
         except OSError as e:
             print(e)
 
     def open(self):
-        if os.path.exists(self.fifo_path) == False:
-            self.create()
+        # fcntl is POSIX only, import it here so the module still loads on
+        # Windows
+        import fcntl
+
+        self.create()
         try:
-            self.fifo_worker = open(self.fifo_path, "ab")
+            # Raw descriptor, so every write goes straight to the reader.
+            # A non-blocking open fails with ENXIO until a reader attaches,
+            # poll it so the worker can still be cancelled meanwhile
+            while not self.fifo_recv_cancel:
+                try:
+                    fd = os.open(self.fifo_path, os.O_WRONLY | os.O_NONBLOCK)
+                except OSError as e:
+                    if e.errno != errno.ENXIO:
+                        raise
+                    time.sleep(FIFO_OPEN_POLL_INTERVAL)
+                    continue
+                flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+                fcntl.fcntl(fd, fcntl.F_SETFL, flags & ~os.O_NONBLOCK)
+                self.fifo_worker = fd
+                break
         except OSError as e:
             print(e)
 
+    def write(self, *chunks: bytes):
+        # Gather all chunks in one syscall; a pipe write can be partial, so
+        # keep writing until all bytes are out
+        written = os.writev(self.fifo_worker, chunks)
+        if written < sum(len(chunk) for chunk in chunks):
+            data = memoryview(b"".join(chunks))[written:]
+            while data:
+                written = os.write(self.fifo_worker, data)
+                data = data[written:]
+
     def run(self):
         self.fifo_recv_cancel = False
         if self.fifo_worker is None:
@@ -74,15 +110,14 @@ class FifoLinux(Fifo):
             try:
                 if self.fifo_packet:
                     if self.fifo_packet != self.last_packet:
+                        # print("WRITING FIFO")
                         if self.fifo_need_header:
-                            self.fifo_worker.write(
-                                Pcap.get_global_header(self.linktype)
+                            self.write(
+                                Pcap.get_global_header(self.linktype), self.fifo_packet
                             )
-                            self.fifo_worker.flush()
                             self.fifo_need_header = False
-                        # print("WRITING FIFO")
-                        self.fifo_worker.write(self.fifo_packet)
-                        self.fifo_worker.flush()
+                        else:
+                            self.write(self.fifo_packet)
                         self.last_packet = self.fifo_packet
                         self.fifo_packet = None
 
@@ -98,8 +133,6 @@ class FifoLinux(Fifo):
     def stop_worker(self):
         self.fifo_recv_cancel = True
         self.fifo_data = []
-        if self.fifo_worker:
-            self.fifo_worker.close()
         try:
             os.remove(self.fifo_path)
         except FileNotFoundError as e:
@@ -107,6 +140,11 @@ class FifoLinux(Fifo):
             sys.exit(0)
         finally:
             self.join(JOIN_TIMEOUT)
+            # Close only once run() is done writing: the descriptor number is
+            # reused by the next opened file, a late write would land there
+            if self.fifo_worker is not None and not self.is_alive():
+                os.close(self.fifo_worker)
+                self.fifo_worker = None
 
     def add_data(self, data):
         self.fifo_packet = data
@@ -117,6 +155,7 @@ class FifoLinux(Fifo):
 
 class FifoWindows(Fifo):
     def __init__(self, fifo_filname: str = DEFAULT_FILENAME):
+        load_pywin32()
         super().__init__()
         self.fifo_filname = fifo_filname
         self.fifo_worker = None
@@ -145,7 +184,7 @@ class FifoWindows(Fifo):
             self.create()
         try:
             win32pipe.ConnectNamedPipe(self.fifo_worker, None)
-            logging.info(f"[FIFOWINDOWS] Open {self.fifo_path}")
+            logging.info("[FIFOWINDOWS] Open %s", self.fifo_path)
         except pywintypes.error as e:
             typer.secho(f"[FIFOWINDOWS] - {e}", fg=typer.colors.BRIGHT_RED)
 
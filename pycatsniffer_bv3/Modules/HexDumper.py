@@ -29,10 +29,11 @@ class HexDumper(threading.Thread):
         self.filename = filename
 
     def run(self):
-        if not os.path.exists(self.get_filename()):
-            os.makedirs(os.path.dirname(self.get_filename()), exist_ok=True)
+        # get_filename is randomized, so resolve it once for this dump
+        dumper_filename = self.get_filename()
+        os.makedirs(os.path.dirname(dumper_filename), exist_ok=True)
 
-        dumper_file = open(self.get_filename(), "ab")
+        dumper_file = open(dumper_filename, "ab")
         while self.running:
             if self.frame_packet:
                 if self.frame_packet != self.last_packet:
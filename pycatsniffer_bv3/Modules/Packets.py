@@ -3,6 +3,13 @@ import binascii
 
 from .Definitions import BaseEnum
 
+# Precompiled frame layouts, shared by every dissected packet
+LORA_UART_HEADER = struct.Struct("<HH")
+UART_HEADER = struct.Struct("<HBH")
+UINT16_LE = struct.Struct("<H")
+# 48-bit timestamps are read as the upper bytes of a little-endian u64
+TIMESTAMP_SHIFT = 16
+
 
 class PacketCategories(BaseEnum):
     RESERVED = 0x0
@@ -22,6 +29,17 @@ class PacketResponsesTypes(BaseEnum):
 
 
 class LoraGeneralUARTPacket:
+    # Dissected once per received frame, keep instances small
+    __slots__ = (
+        "type_packet",
+        "packet_bytes",
+        "start_of_frame",
+        "packet_info",
+        "packet_length",
+        "bytes_payload",
+        "end_of_frame",
+    )
+
     def __init__(self, packet_bytes: bytes) -> None:
         self.type_packet = "LoraUARTPacket"
         self.packet_bytes = packet_bytes
@@ -37,9 +55,9 @@ class LoraGeneralUARTPacket:
         (
             self.start_of_frame,
             self.packet_length,
-        ) = struct.unpack_from("<HH", self.packet_bytes)
+        ) = LORA_UART_HEADER.unpack_from(self.packet_bytes)
         self.bytes_payload = self.packet_bytes[4:-2]
-        (self.end_of_frame,) = struct.unpack_from("<H", self.packet_bytes[-2:])
+        (self.end_of_frame,) = UINT16_LE.unpack_from(self.packet_bytes, -2)
 
     def get_payload_hex(self) -> str:
         return binascii.hexlify(self.packet_bytes)
@@ -51,14 +69,19 @@ Packet Length : {self.packet_length} {int(self.packet_length).to_bytes(2, byteor
 Bytes  Payload: {self.bytes_payload}"""
 
     def hex_digiest(self, packet_bytes: bytes) -> str:
-        string_hex = packet_bytes.hex()
-        return " ".join([string_hex[i : i + 2] for i in range(0, len(string_hex), 2)])
+        return packet_bytes.hex(" ")
 
     def __str__(self) -> str:
         return self.digiest()
 
 
 class LoraUARTPacket(LoraGeneralUARTPacket):
+    __slots__ = (
+        "payload",
+        "rssi",
+        "snr",
+    )
+
     def __init__(self, packet_bytes: bytes) -> None:
         super().__init__(packet_bytes)
         self.type_packet = "LoraUARTPacket"
@@ -70,7 +93,7 @@ class LoraUARTPacket(LoraGeneralUARTPacket):
     def unpack(self) -> None:
         super().unpack()
         self.payload = self.bytes_payload[:-2]
-        (self.rssi,) = struct.unpack_from("<H", self.bytes_payload[-2:])
+        (self.rssi,) = UINT16_LE.unpack_from(self.bytes_payload, -2)
         # self.rssi = self.bytes_payload[-2:]
         # self.snr = self.bytes_payload[-1:]
 
@@ -87,6 +110,16 @@ DATA     : {binascii.hexlify(self.packet_bytes)}
 
 
 class GeneralUARTPacket:
+    __slots__ = (
+        "type_packet",
+        "packet_bytes",
+        "start_of_frame",
+        "packet_info",
+        "packet_length",
+        "bytes_payload",
+        "end_of_frame",
+    )
+
     def __init__(self, packet_bytes: bytes) -> None:
         self.type_packet = "GeneralUARTPacket"
         self.packet_bytes = packet_bytes
@@ -103,9 +136,9 @@ class GeneralUARTPacket:
             self.start_of_frame,
             self.packet_info,
             self.packet_length,
-        ) = struct.unpack_from("<HBH", self.packet_bytes)
+        ) = UART_HEADER.unpack_from(self.packet_bytes)
         self.bytes_payload = self.packet_bytes[5:-2]
-        (self.end_of_frame,) = struct.unpack_from("<H", self.packet_bytes[-2:])
+        (self.end_of_frame,) = UINT16_LE.unpack_from(self.packet_bytes, -2)
 
     def is_data_packet(self) -> bool:
         return (
@@ -154,14 +187,20 @@ Packet Length : {self.packet_length}
 Bytes  Payload: {self.bytes_payload}"""
 
     def hex_digiest(self, packet_bytes: bytes) -> str:
-        string_hex = packet_bytes.hex()
-        return " ".join([string_hex[i : i + 2] for i in range(0, len(string_hex), 2)])
+        return packet_bytes.hex(" ")
 
     def __str__(self) -> str:
         return self.digiest()
 
 
 class DataUARTPacket(GeneralUARTPacket):
+    __slots__ = (
+        "timestamp",
+        "payload",
+        "rssi",
+        "status",
+    )
+
     def __init__(self, packet_bytes: bytes) -> None:
         super().__init__(packet_bytes)
         self.type_packet = "DataUARTPacket"
@@ -175,7 +214,7 @@ class DataUARTPacket(GeneralUARTPacket):
     def unpack(self) -> None:
         super().unpack()
         timestamp_usec = self.bytes_payload[:6]  # useconds
-        timestamp_unpack = struct.unpack("<Q", (b"\x00\x00" + timestamp_usec))[0]
+        timestamp_unpack = int.from_bytes(timestamp_usec, "little") << TIMESTAMP_SHIFT
         self.timestamp = timestamp_unpack / 1000000  # seconds
         self.rssi = self.bytes_payload[-2:-1]
         self.status = self.bytes_payload[-1]
@@ -203,6 +242,16 @@ DATA     : {binascii.hexlify(self.payload)}
 
 
 class BLEUARTPacket(GeneralUARTPacket):
+    __slots__ = (
+        "timestamp",
+        "payload",
+        "channel",
+        "rssi",
+        "status",
+        "connect_evt",
+        "conn_info",
+    )
+
     def __init__(self, packet_bytes: bytes) -> None:
         super().__init__(packet_bytes)
         self.type_packet = "BLEUARTPacket"
@@ -218,7 +267,7 @@ class BLEUARTPacket(GeneralUARTPacket):
     def unpack(self) -> None:
         super().unpack()
         timestamp_usec = self.bytes_payload[:6]
-        timestamp_unpack = struct.unpack("<Q", (b"\x00\x00" + timestamp_usec))[0]
+        timestamp_unpack = int.from_bytes(timestamp_usec, "little") << TIMESTAMP_SHIFT
         self.timestamp = timestamp_unpack / 1000000
         tmp_payload = self.packet_bytes[11:-4]
         # META BLE
@@ -249,6 +298,16 @@ Payload HEX      : {self.hex_digiest(self.payload)}"""
 
 
 class IEEEUARTPacket(GeneralUARTPacket):
+    __slots__ = (
+        "timestamp",
+        "payload",
+        "channel",
+        "rssi",
+        "status",
+        "connect_evt",
+        "conn_info",
+    )
+
     def __init__(self, packet_bytes: bytes) -> None:
         super().__init__(packet_bytes)
         self.type_packet = "IEEEUARTPacket"
@@ -262,7 +321,7 @@ class IEEEUARTPacket(GeneralUARTPacket):
     def unpack(self) -> None:
         super().unpack()
         timestamp_usec = self.bytes_payload[:6]
-        timestamp_unpack = struct.unpack("<Q", (b"\x00\x00" + timestamp_usec))[0]
+        timestamp_unpack = int.from_bytes(timestamp_usec, "little") << TIMESTAMP_SHIFT
         self.timestamp = timestamp_unpack / 1000000
         tmp_payload = self.packet_bytes[11:-4]
         self.channel = tmp_payload[0]
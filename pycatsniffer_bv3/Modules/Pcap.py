@@ -1,5 +1,4 @@
 import struct
-import binascii
 from .Definitions import (
     LINKTYPE_BLUETOOTH_LE_LL_WITH_PHDR,
     PCAP_GLOBAL_HEADER_FORMAT,
@@ -10,10 +9,13 @@ from .Definitions import (
     PCAP_PACKET_HEADER_FORMAT,
 )
 
+# Precompiled headers, so the format strings are not parsed per packet
+PCAP_GLOBAL_HEADER = struct.Struct(PCAP_GLOBAL_HEADER_FORMAT)
+PCAP_PACKET_HEADER = struct.Struct(PCAP_PACKET_HEADER_FORMAT)
+
 
 def get_global_header(interface=LINKTYPE_BLUETOOTH_LE_LL_WITH_PHDR):
-    global_header = struct.pack(
-        PCAP_GLOBAL_HEADER_FORMAT,
+    global_header = PCAP_GLOBAL_HEADER.pack(
         PCAP_MAGIC_NUMBER,
         PCAP_VERSION_MAJOR,
         PCAP_VERSION_MINOR,
@@ -26,19 +28,29 @@ def get_global_header(interface=LINKTYPE_BLUETOOTH_LE_LL_WITH_PHDR):
 
 
 class Pcap:
-    def __init__(self, packet: bytes, timestamp_seconds: float):
+    # One instance per captured packet, keep them small
+    __slots__ = ("packet", "timestamp_ns", "_pcap_packet", "_pcap_hex")
+
+    def __init__(self, packet: bytes, timestamp_ns: int):
         self.packet = packet
-        self.timestamp_seconds = timestamp_seconds
-        self.pcap_packet = self.pack()
+        self.timestamp_ns = timestamp_ns
+        # Packed record and its hex form, built on first use
+        self._pcap_packet = None
+        self._pcap_hex = None
+
+    @property
+    def pcap_packet(self) -> bytes:
+        if self._pcap_packet is None:
+            self._pcap_packet = self.pack()
+        return self._pcap_packet
 
     def pack(self):
-        int_timestamp = int(self.timestamp_seconds)
-        timestamp_offset = int((self.timestamp_seconds - int_timestamp) / 1_000_000)
+        int_timestamp, timestamp_ns = divmod(self.timestamp_ns, 1_000_000_000)
+        timestamp_offset = timestamp_ns // 1000
         return (
-            struct.pack(
-                PCAP_PACKET_HEADER_FORMAT,  # Block Type
+            PCAP_PACKET_HEADER.pack(
                 int_timestamp,  # timestamp_seconds,
-                timestamp_offset,  # timestamp_offset,
+                timestamp_offset,  # timestamp_microseconds,
                 len(self.packet),  # Snapshot Length
                 len(self.packet),  # Packet Length
             )
@@ -52,7 +64,9 @@ class Pcap:
         return self.pcap_packet
 
     def pcap_hex(self):
-        return binascii.hexlify(self.pcap_packet).decode("utf-8")
+        if self._pcap_hex is None:
+            self._pcap_hex = self.pcap_packet.hex()
+        return self._pcap_hex
 
     def __str__(self) -> str:
         return f"{self.packet}"
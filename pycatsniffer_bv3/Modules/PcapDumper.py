@@ -17,10 +17,8 @@ class PcapDumper(threading.Thread):
     def __init__(self, filename: str = DEFAULT_FILENAME):
         super().__init__()
         self.filename = filename
+        # Records waiting to be written, drained as one batch
         self.data_queue = []
-        self.data_length = 0
-        self.last_packet = None
-        self.frame_packet = None
         self.data_queue_lock = threading.Lock()
         self.running = True
         self.needs_header = True
@@ -42,32 +40,37 @@ class PcapDumper(threading.Thread):
         self.linktype = linktype
 
     def run(self):
-        if not os.path.exists(self.get_filename()):
-            os.makedirs(os.path.dirname(self.get_filename()), exist_ok=True)
+        # get_filename is randomized, so resolve it once for this dump
+        dumper_filename = self.get_filename()
+        os.makedirs(os.path.dirname(dumper_filename), exist_ok=True)
 
-        dumper_file = open(self.get_filename(), "ab")
-        while self.running:
-            if self.frame_packet:
-                if self.frame_packet != self.last_packet:
-                    if self.needs_header:
-                        dumper_file.write(get_global_header(self.linktype))
-                        dumper_file.flush()
-                        self.needs_header = False
+        with open(dumper_filename, "ab") as dumper_file:
+            while self.running:
+                if not self.write_pending(dumper_file):
+                    time.sleep(0.01)
+            # Do not lose what arrived while stopping
+            self.write_pending(dumper_file)
 
-                    dumper_file.write(self.frame_packet)
-                    dumper_file.flush()
-                    self.last_packet = self.frame_packet
-                    self.frame_packet = None
-            else:
-                time.sleep(0.01)
+    def write_pending(self, dumper_file):
+        with self.data_queue_lock:
+            packets, self.data_queue = self.data_queue, []
+        if not packets:
+            return False
+        if self.needs_header:
+            packets.insert(0, get_global_header(self.linktype))
+            self.needs_header = False
+        # One write and flush per batch instead of per packet
+        dumper_file.write(b"".join(packets))
+        dumper_file.flush()
+        return True
 
     def stop_thread(self):
         self.join()
 
     def stop_worker(self):
         self.running = False
-        self.frame_packet = None
         self.join()
 
     def add_data(self, data):
-        self.frame_packet = data
+        with self.data_queue_lock:
+            self.data_queue.append(data)
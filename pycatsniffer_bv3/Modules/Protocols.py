@@ -1,4 +1,6 @@
 from enum import Enum
+from functools import cached_property, lru_cache
+from types import MappingProxyType
 from . import Definitions
 
 
@@ -12,9 +14,9 @@ class Protocol:
         phy_label: str = "Base Protocol",
         base_frequency: float = 0,
         spacing: float = 0,
-        channel_range: list = [0, 0],
+        channel_range: list = (0, 0),
         pcap_header: int = 147,
-        common_names: list = [],
+        common_names: list = (),
         profile: str = "Default",
     ):
         self.phy_index = phy_index
@@ -91,55 +93,71 @@ class Protocol:
         frequency_fract_bytes = frequency_fract.to_bytes(2, byteorder="little")
         return frequency_int_bytes + frequency_fract_bytes
 
+    @cached_property
+    def channel_map(self) -> dict:
+        return {channel[0]: channel for channel in self.channel_range}
+
+    @cached_property
+    def channel_frequency_bytes(self) -> dict:
+        # Frequency command payload of every channel, computed once
+        return {
+            channel: self.calculate_frequency(frequency)
+            for channel, frequency in self.channel_range
+        }
+
     def get_channel_bytes(self, channel_index: int) -> bytes:
         """Return the channel in bytes"""
-        for _channel in self.channel_range:
-            if _channel[0] == channel_index:
-                return _channel[1]
-        return b""
+        _channel = self.channel_map.get(channel_index)
+        return _channel[1] if _channel else b""
 
     def get_channel_range_bytes(self, channel: int) -> int:
         """Return the channel range in bytes"""
-        for _channel in self.channel_range:
-            if _channel[0] == channel:
-                return _channel
-        return 0
+        return self.channel_map.get(channel, 0)
 
     def get_frequency_by_channel(self, channel: int) -> float:
         """Return the frequency by channel"""
-        for _channel in self.channel_range:
-            if _channel[0] == channel:
-                return _channel[1]
-        return 0
+        _channel = self.channel_map.get(channel)
+        return _channel[1] if _channel else 0
 
-    def command_start(self) -> bytes:
+    @staticmethod
+    def command_start() -> bytes:
         """Return the start command of the protocol"""
         return Definitions.PacketCommand(Definitions.SnifferCommands.CMD_START.value)
 
-    def command_stop(self) -> bytes:
+    @staticmethod
+    def command_stop() -> bytes:
         """Return the start command of the protocol"""
         return Definitions.PacketCommand(Definitions.SnifferCommands.CMD_STOP.value)
 
-    def command_ping(self) -> bytes:
+    @staticmethod
+    def command_ping() -> bytes:
         """Return the ping command of the protocol"""
         return Definitions.PacketCommand(Definitions.SnifferCommands.CMD_PING.value)
 
-    def command_cfg_phy(self) -> bytes:
-        """Return the command for configure the PHY"""
+    @cached_property
+    def phy_command(self):
+        # The PHY of a protocol never changes, so neither does its command
         return Definitions.PacketCommand(
             Definitions.SnifferCommands.CMD_CFG_PHY.value, bytes(self.phy_index)
         )
 
+    def command_cfg_phy(self) -> bytes:
+        """Return the command for configure the PHY"""
+        return self.phy_command
+
     def command_cfg_frequency(self, channel: int) -> bytes:
         """Return the command for configure the frequency"""
-        get_channel = self.get_channel_bytes(channel)
-        get_frequency = self.calculate_frequency(get_channel)
+        get_frequency = self.channel_frequency_bytes.get(channel)
+        if get_frequency is None:
+            get_channel = self.get_channel_bytes(channel)
+            get_frequency = self.calculate_frequency(get_channel)
 
         return Definitions.PacketCommand(
             Definitions.SnifferCommands.CMD_CFG_FREQUENCY.value, get_frequency
         )
 
-    def command_cfg_init_address(self, address: bytes) -> bytes:
+    @staticmethod
+    def command_cfg_init_address(address: bytes) -> bytes:
         """Return the command for configure the initiator address"""
         return Definitions.PacketCommand(
             Definitions.SnifferCommands.CMD_CFG_BLE_INITIATOR_ADDRESS.value, address
@@ -155,12 +173,9 @@ class Protocol:
             self.command_start(),
         ]
 
-    @property
+    @cached_property
     def list_channel_range(self):
-        channels = []
-        for channel in self.channel_range:
-            channels.append(channel[0])
-        return channels
+        return [channel[0] for channel in self.channel_range]
 
     def __str__(self):
         return f"PHY Index: {self.phy_index}\nName: {self.name}\nPHY Label: {self.phy_label}\nBase Frequency: {self.base_frequency}\nSpacing: {self.spacing}\nChannel Range: {self.channel_range}\nPCAP Header: {self.pcap_header}"
@@ -177,15 +192,18 @@ PROTOCOL_BLE = Protocol(
     common_names=["ble", "bluetooth", "bluetoothle"],
 )
 
+# Zigbee and Thread share the 2.4 GHz IEEE 802.15.4 channel plan
+IEEE_802_15_4_CHANNELS = [
+    (channel, (2405.0 + (5 * (channel - 11)))) for channel in range(11, 27)
+]
+
 PROTOCOL_ZIGBEE = Protocol(
     phy_index=bytearray([0x12]),
     name="Zigbee",
     phy_label="2405 MHz - Freq Band",
     base_frequency=2405.0,
     spacing=5,
-    channel_range=[
-        (channel, (2405.0 + (5 * (channel - 11)))) for channel in range(11, 27)
-    ],
+    channel_range=IEEE_802_15_4_CHANNELS,
     pcap_header=147,
     common_names=["zigbee", "zig", "zb"],
     profile="Zigbee",
@@ -197,9 +215,7 @@ PROTOCOL_THREAD = Protocol(
     phy_label="2405 MHz - Freq Band",
     base_frequency=2405.0,
     spacing=5,
-    channel_range=[
-        (channel, (2405.0 + (5 * (channel - 11)))) for channel in range(11, 27)
-    ],
+    channel_range=IEEE_802_15_4_CHANNELS,
     pcap_header=147,
     common_names=["thread"],
     profile="Thread",
@@ -245,33 +261,43 @@ class PROTOCOLSLIST(Definitions.BaseEnum):
 
     @classmethod
     def get_list_protocols(cls):
-        return list(cls)
+        return list(cls.members())
 
+    # The protocol table is static, so its listings are built once
     @classmethod
+    @lru_cache(maxsize=None)
     def get_str_list_protocols(cls):
-        str_list = ""
-        for index, protocol in enumerate(cls):
-            str_list += f"[{index}] {protocol.name}\n"
-        return str_list
+        return "".join(
+            f"[{index}] {protocol.name}\n"
+            for index, protocol in enumerate(cls.members())
+        )
 
     @classmethod
+    @lru_cache(maxsize=None)
     def get_str_list_channels(cls, protocol_index: int):
         get_protocol = cls.get_by_index(protocol_index)
-        str_list = ""
-        for channel in get_protocol.value.channel_range:
-            str_list += f"[{channel[0]}] {channel[1]}\n"
-        return str_list
+        return "".join(
+            f"[{channel[0]}] {channel[1]}\n"
+            for channel in get_protocol.value.channel_range
+        )
 
     @classmethod
     def get_protocol_by_name(cls, name: str):
-        for protocol in cls:
-            if protocol.name == name:
-                return protocol
-            else:
-                get_protocol = protocol.value.find_by_name(name)
-                if get_protocol:
-                    return get_protocol
-        return None
+        return PROTOCOLS_BY_NAME.get(name)
 
     def __str__(self):
         return super().__str__()
+
+
+def _build_protocols_by_name():
+    # Enum member names resolve to the member, common names to the Protocol,
+    # first match wins as in the original linear scan.
+    protocols_by_name = {}
+    for protocol in PROTOCOLSLIST:
+        protocols_by_name.setdefault(protocol.name, protocol)
+        for common_name in protocol.value.common_names:
+            protocols_by_name.setdefault(common_name, protocol.value)
+    return MappingProxyType(protocols_by_name)
+
+
+PROTOCOLS_BY_NAME = _build_protocols_by_name()
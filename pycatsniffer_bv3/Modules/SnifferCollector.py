@@ -1,24 +1,72 @@
 import time
+import queue
 import struct
 import threading
 import typer
 import sys
 import platform
+from functools import lru_cache
 from traceback import format_exception
 from .Worker import WorkerManager
 from .UART import UART
 from .Pcap import Pcap
-from .Packets import GeneralUARTPacket, IEEEUARTPacket, BLEUARTPacket, LoraUARTPacket
+from .Packets import (
+    IEEEUARTPacket,
+    BLEUARTPacket,
+    LoraUARTPacket,
+    PacketCategories,
+)
 from .Definitions import DEFAULT_TIMEOUT_JOIN
 from .Protocols import (
     PROTOCOL_BLE,
     PROTOCOL_ZIGBEE,
-    PROTOCOL_LORA,
     PROTOCOL_THREAD,
     PROTOCOLSLIST,
 )
 from .Utils import LOG_ERROR, LOG_WARNING, LOG_INFO
 
+# Seconds the data handler waits for a packet before checking for a cancel
+SNIFFER_DATA_TIMEOUT = 0.1
+# Version, length, interface type and id, protocol, PHY, frequency, channel,
+# RSSI and status of a 2.4 GHz capture, the connection event and info follow
+PACKET_HEADER = struct.Struct("<cHc2sccIHBB")
+# Version, length, interface type and id, protocol, PHY, frequency, channel,
+# bandwidth, spreading factor, coding rate and RSSI of a LoRa capture
+LORA_PACKET_HEADER = struct.Struct("<cHc2sccIHBBBH")
+# The packet info byte follows the start of frame
+PACKET_INFO_INDEX = 2
+COMMAND_PACKET_CATEGORIES = frozenset(
+    (PacketCategories.COMMAND.value, PacketCategories.COMMAND_RESPONSE.value)
+)
+# Packet class used to dissect the frames of each protocol
+PACKET_DISSECTORS = {
+    PROTOCOL_BLE: BLEUARTPacket,
+    PROTOCOL_ZIGBEE: IEEEUARTPacket,
+    PROTOCOL_THREAD: IEEEUARTPacket,
+}
+
+
+@lru_cache(maxsize=None)
+def get_capture_header_ids(protocol, board: int) -> tuple:
+    """Return the interface id, protocol and PHY bytes of the capture header"""
+    interface_id = b"\x03\x00"
+    protocol_id = b"\x03"
+    phy = b"\x05"
+    if protocol == PROTOCOL_BLE:
+        protocol_id = b"\x03"
+        phy = b"\x05"
+    elif protocol == PROTOCOL_ZIGBEE or protocol == PROTOCOL_THREAD:
+        protocol_id = b"\x02"
+        phy = b"\x03"
+
+    if board == 1:
+        interface_id = b"\x02\x00"
+
+    if board == 2:
+        protocol_id = b"\x05"
+        phy = b"\x06"
+    return interface_id, protocol_id, phy
+
 
 class TrivialLogger:
     def _log(self, msg, *args, exc_info=None, **kwargs):
@@ -49,6 +97,9 @@ class SnifferCollector(threading.Thread):
         self.sniffer_worker = WorkerManager()
         self.board_uart = UART()
         self.output_workers = []
+        # Output workers split by the data they take, see set_output_workers
+        self.raw_workers = []
+        self.pcap_workers = []
         self.protocol = PROTOCOL_BLE
         self.protocol_freq_channel = 37
         self.protocol_linktype = PROTOCOL_BLE.get_pcap_header()
@@ -57,6 +108,7 @@ class SnifferCollector(threading.Thread):
         self.pcap_size = 0
         # QUEUE
         self.data_queue_lock = threading.Lock()
+        self.sniffer_data_queue = queue.Queue()
         self.sniffer_recv_cancel = False
         # Boards
         self.is_catsniffer = 0
@@ -71,6 +123,10 @@ class SnifferCollector(threading.Thread):
         self.lora_frequency = 0
         self.lora_spreading_factor = 0
         self.lora_coding_rate = 0
+        # Last LoRa config values sent to the board, by command
+        self.lora_config_sent = {}
+        # Startup command packets, by (protocol, channel, initiator address)
+        self.startup_commands = {}
         self.logger = logger if logger else TrivialLogger()
 
     def set_is_catsniffer(self, is_catsniffer: int):
@@ -101,6 +157,13 @@ class SnifferCollector(threading.Thread):
 
     def set_output_workers(self, output_workers):
         self.output_workers = output_workers
+        # Sort the workers once instead of comparing their type per packet
+        self.raw_workers = [
+            worker for worker in output_workers if worker.type_worker == "raw"
+        ]
+        self.pcap_workers = [
+            worker for worker in output_workers if worker.type_worker == "pcap"
+        ]
 
     def set_board_uart(self, board_uart) -> bool:
         self.board_uart.set_serial_port(board_uart)
@@ -157,18 +220,31 @@ class SnifferCollector(threading.Thread):
         get_protocol_command = self.protocol.command_cfg_init_address(address)
         self.board_uart.send(get_protocol_command.raw_packet)
 
+    def get_startup_commands(self) -> list:
+        """Return the raw startup packets for the current configuration"""
+        key = (self.protocol, self.protocol_freq_channel, self.initiator_address)
+        startup_commands = self.startup_commands.get(key)
+        if startup_commands is None:
+            get_protocol_commands = self.protocol.command_startup(
+                self.protocol_freq_channel
+            )
+            if self.initiator_address:
+                get_protocol_commands.insert(
+                    4, self.protocol.command_cfg_init_address(self.initiator_address)
+                )
+            startup_commands = [command.raw_packet for command in get_protocol_commands]
+            self.startup_commands[key] = startup_commands
+        return startup_commands
+
     def send_command_start(self):
         """Send the start command to the sniffer"""
-        get_protocol_commands = self.protocol.command_startup(
-            self.protocol_freq_channel
-        )
-        if self.initiator_address:
-            get_protocol_commands.insert(
-                4, self.protocol.command_cfg_init_address(self.initiator_address)
-            )
-        for command in get_protocol_commands:
-            self.board_uart.send(command.raw_packet)
-            time.sleep(0.1)
+        startup_commands = self.get_startup_commands()
+        # Give the board time to process each command before the next one,
+        # nothing follows the last one so there is no need to wait after it
+        for index, command in enumerate(startup_commands):
+            if index:
+                time.sleep(0.1)
+            self.board_uart.send(command)
 
     def get_interface(self):
         interface_bytes = self.board_uart.get_serial_port()
@@ -182,99 +258,84 @@ class SnifferCollector(threading.Thread):
                 interface_bytes = interface_bytes.encode("utf-8")
         return interface_bytes
 
+    def get_pcap_packet(self, timestamp_ns: int) -> bytes:
+        """Build the PCAP record of the current sniffer data"""
+        try:
+            version = b"\x00"
+            interfaceType = b"\x00"
+            interfaceId, protocol, phy = get_capture_header_ids(
+                self.protocol, self.is_catsniffer
+            )
+            if self.is_catsniffer == 2:
+                self.protocol_linktype = 148
+                packet = (
+                    LORA_PACKET_HEADER.pack(
+                        version,
+                        self.sniffer_data.packet_length,
+                        interfaceType,
+                        interfaceId,
+                        protocol,
+                        phy,
+                        int(self.lora_frequency),
+                        int(self.lora_channel),
+                        int(self.lora_bandwidth),
+                        int(self.lora_spreading_factor),
+                        int(self.lora_coding_rate),
+                        int(self.sniffer_data.rssi),
+                    )
+                    + self.sniffer_data.payload
+                )
+            else:
+                channel, frequency = self.protocol.get_channel_range_bytes(
+                    self.protocol_freq_channel
+                )
+                packet = b"".join(
+                    [
+                        PACKET_HEADER.pack(
+                            version,
+                            self.sniffer_data.packet_length,
+                            interfaceType,
+                            interfaceId,
+                            protocol,
+                            phy,
+                            int(frequency),
+                            int(channel),
+                            self.sniffer_data.rssi,
+                            self.sniffer_data.status,
+                        ),
+                        self.sniffer_data.connect_evt,
+                        bytes((self.sniffer_data.conn_info,)),
+                        self.sniffer_data.payload,
+                    ]
+                )
+            return Pcap(packet, timestamp_ns).get_pcap()
+        except struct.error as e:
+            LOG_ERROR(f"Error: {str(e)}")
+            LOG_ERROR(f"Packet: {self.sniffer_data}")
+            return b""
+
     def handle_sniffer_data(self):
         while not self.sniffer_recv_cancel:
-            if self.sniffer_recv_cancel:
-                break
+            # Block until the receiver hands over a packet, waking up now and
+            # then to notice a cancellation
+            try:
+                timestamp_ns, self.sniffer_data = self.sniffer_data_queue.get(
+                    timeout=SNIFFER_DATA_TIMEOUT
+                )
+            except queue.Empty:
+                continue
             if self.sniffer_data:
                 # Send to the dumpers
-                for output_worker in self.output_workers:
-                    if output_worker.type_worker == "raw":
-                        output_worker.add_data(self.sniffer_data.payload)
-                    elif output_worker.type_worker == "pcap":
-                        try:
-                            version = b"\x00"
-                            interfaceType = b"\x00"
-                            interfaceId = bytes.fromhex("0300")
-                            protocol = b"\x03"
-                            phy = bytes.fromhex("05")
-                            if self.protocol == PROTOCOL_BLE:
-                                protocol = b"\x03"
-                                phy = bytes.fromhex("05")
-                            elif (
-                                self.protocol == PROTOCOL_ZIGBEE
-                                or self.protocol == PROTOCOL_THREAD
-                            ):
-                                protocol = b"\x02"
-                                phy = bytes.fromhex("03")
-
-                            if self.is_catsniffer == 1:
-                                interfaceId = bytes.fromhex("0200")
-
-                            if self.is_catsniffer == PROTOCOL_LORA:
-                                protocol = b"\x05"
-                                phy = bytes.fromhex("06")
-
-                            if self.is_catsniffer == 2:
-                                self.protocol_linktype = 148
-                                packet = (
-                                    version
-                                    + self.sniffer_data.packet_length.to_bytes(
-                                        2, "little"
-                                    )
-                                    + interfaceType
-                                    + interfaceId
-                                    + protocol
-                                    + phy
-                                    + int(self.lora_frequency).to_bytes(4, "little")
-                                    + int(self.lora_channel).to_bytes(2, "little")
-                                    + int(self.lora_bandwidth).to_bytes(1, "little")
-                                    + int(self.lora_spreading_factor).to_bytes(
-                                        1, "little"
-                                    )
-                                    + int(self.lora_coding_rate).to_bytes(1, "little")
-                                    + int(self.sniffer_data.rssi).to_bytes(2, "little")
-                                    + self.sniffer_data.payload
-                                )
-                            else:
-                                packet = (
-                                    version
-                                    + self.sniffer_data.packet_length.to_bytes(
-                                        2, "little"
-                                    )
-                                    + interfaceType
-                                    + interfaceId
-                                    + protocol
-                                    + phy
-                                    + int(
-                                        self.protocol.get_channel_range_bytes(
-                                            self.protocol_freq_channel
-                                        )[1]
-                                    ).to_bytes(4, "little")
-                                    + int(
-                                        self.protocol.get_channel_range_bytes(
-                                            self.protocol_freq_channel
-                                        )[0]
-                                    ).to_bytes(2, "little")
-                                    + self.sniffer_data.rssi.to_bytes(1, "little")
-                                    + self.sniffer_data.status.to_bytes(1, "little")
-                                    + self.sniffer_data.connect_evt
-                                    + self.sniffer_data.conn_info.to_bytes(1, "little")
-                                    + self.sniffer_data.payload
-                                )
-                            pcap_file = Pcap(packet, time.time())
+                for output_worker in self.raw_workers:
+                    output_worker.add_data(self.sniffer_data.payload)
+                if self.pcap_workers:
+                    # The PCAP record is the same for every pcap worker
+                    pcap_packet = self.get_pcap_packet(timestamp_ns)
+                    if pcap_packet:
+                        for output_worker in self.pcap_workers:
                             output_worker.set_linktype(self.protocol_linktype)
-                            output_worker.add_data(pcap_file.get_pcap())
-                        except struct.error as e:
-                            LOG_ERROR(f"Error: {str(e)}")
-                            LOG_ERROR(f"Packet: {self.sniffer_data}")
-                            continue
-                    else:
-                        time.sleep(0.01)
-                        continue
+                            output_worker.add_data(pcap_packet)
                 self.sniffer_data = None
-            else:
-                time.sleep(0.01)
 
     def dissector(self, packet: bytes) -> bytes:
         """Dissector the packet"""
@@ -282,26 +343,26 @@ class SnifferCollector(threading.Thread):
             data_packet = LoraUARTPacket(packet)
             return data_packet
 
-        general_packet = GeneralUARTPacket(packet)
-        if general_packet.is_command_response_packet():
+        # Command responses are told apart by the category bits of the packet
+        # info byte, check them before dissecting the whole frame
+        packet_category = (packet[PACKET_INFO_INDEX] >> 6) & 0b11
+        if packet_category in COMMAND_PACKET_CATEGORIES:
             return None
 
+        packet_bytes = packet
         packet = None
         try:
-            if self.protocol == PROTOCOL_BLE:
-                data_packet = BLEUARTPacket(general_packet.packet_bytes)
-                packet = data_packet
-            elif self.protocol == PROTOCOL_ZIGBEE or self.protocol == PROTOCOL_THREAD:
-                ieee_packet = IEEEUARTPacket(general_packet.packet_bytes)
-                packet = ieee_packet
+            packet_class = PACKET_DISSECTORS.get(self.protocol)
+            if packet_class:
+                packet = packet_class(packet_bytes)
             else:
                 self.logger.error("Protocol not supported yet")
                 LOG_WARNING("Protocol not supported yet")
-                LOG_WARNING(f"Packet -> {general_packet}")
+                LOG_WARNING(f"Packet -> {packet_bytes.hex()}")
         except Exception as e:
-            self.logger.error(f"Dissector Error -> {e}")
+            self.logger.error("Dissector Error -> %s", e)
             LOG_WARNING(f"Dissector Error -> {e}")
-            LOG_WARNING(f"Packet -> {general_packet}")
+            LOG_WARNING(f"Packet -> {packet_bytes.hex()}")
             return packet
 
         if self.verbose_mode:
@@ -312,10 +373,13 @@ class SnifferCollector(threading.Thread):
     def hopper_worker(self):
         while not self.sniffer_recv_cancel:
             if self.hopping_channel:
+                # Monotonic clock, so wall clock adjustments do not stall or
+                # rush the hopping
+                now = time.monotonic()
                 if self.last_timestamp is None:
-                    self.last_timestamp = time.time()
-                if (time.time() - self.last_timestamp) >= self.time_hopper:
-                    self.last_timestamp = time.time()
+                    self.last_timestamp = now
+                if (now - self.last_timestamp) >= self.time_hopper:
+                    self.last_timestamp = now
                     if len(self.hopp_channels) == 0:
                         self.hopp_channels = self.protocol.get_channel_range()
 
@@ -329,27 +393,35 @@ class SnifferCollector(threading.Thread):
             time.sleep(0.1)
 
     def set_and_send_lora_config(self):
-        lora_cmd_bandwidth = f"set_bw {self.lora_bandwidth}\r\n"
-        lora_cmd_channel = f"set_chann {self.lora_channel}\r\n"
-        # lora_cmd_frequency = f"set_freq {self.lora_frequency}\r\n"
-        lora_cmd_spreading_factor = f"set_sf {self.lora_spreading_factor}\r\n"
-        lora_cmd_coding_rate = f"set_cr {self.lora_coding_rate}\r\n"
-        self.board_uart.send(bytes(lora_cmd_bandwidth, "utf-8"))
-        self.board_uart.send(bytes(lora_cmd_channel, "utf-8"))
-        # self.board_uart.send(bytes(lora_cmd_frequency, "utf-8"))
-        self.board_uart.send(bytes(lora_cmd_coding_rate, "utf-8"))
-        self.board_uart.send(bytes(lora_cmd_spreading_factor, "utf-8"))
-        self.board_uart.send(b"set_rx\r\n")
-        self.logger.info(f"Bandwidth: {self.lora_bandwidth}")
-        self.logger.info(f"Channel: {self.lora_channel}")
-        self.logger.info(f"Frequency: {self.lora_frequency}")
-        self.logger.info(f"Spreading Factor: {self.lora_spreading_factor}")
-        self.logger.info(f"Coding Rate: {self.lora_coding_rate}")
+        lora_config = (
+            ("set_bw", self.lora_bandwidth),
+            ("set_chann", self.lora_channel),
+            # ("set_freq", self.lora_frequency),
+            ("set_cr", self.lora_coding_rate),
+            ("set_sf", self.lora_spreading_factor),
+        )
+        # Only resend the values that changed since the last config, and
+        # write the whole batch in a single serial transfer
+        lora_cmds = []
+        for command, value in lora_config:
+            if self.lora_config_sent.get(command) != value:
+                lora_cmds.append(f"{command} {value}\r\n")
+                self.lora_config_sent[command] = value
+        lora_cmds.append("set_rx\r\n")
+        self.board_uart.send(bytes("".join(lora_cmds), "utf-8"))
+        self.logger.info("Bandwidth: %s", self.lora_bandwidth)
+        self.logger.info("Channel: %s", self.lora_channel)
+        self.logger.info("Frequency: %s", self.lora_frequency)
+        self.logger.info("Spreading Factor: %s", self.lora_spreading_factor)
+        self.logger.info("Coding Rate: %s", self.lora_coding_rate)
 
     def recv_worker(self):
         try:
             if self.board_uart.is_connected() == False:
                 self.board_uart.open()
+            else:
+                # Drop anything received since the port was validated
+                self.board_uart.reset_buffer()
 
             self.board_uart.set_is_catsniffer(self.is_catsniffer)
 
@@ -357,24 +429,30 @@ class SnifferCollector(threading.Thread):
                 self.send_command_start()
             else:
                 if self.is_catsniffer == 2:
+                    self.lora_config_sent = {}
                     self.set_and_send_lora_config()
                     lora_cmd_frequency = f"set_freq {self.lora_frequency}\r\n"
-                    self.board_uart.send(bytes(lora_cmd_frequency, "utf-8"))
-                    self.logger.info(f"Bandwidth: {self.lora_bandwidth}")
-                    self.logger.info(f"Channel: {self.lora_channel}")
-                    self.logger.info(f"Frequency: {self.lora_frequency}")
-                    self.logger.info(f"Spreading Factor: {self.lora_spreading_factor}")
-                    self.logger.info(f"Coding Rate: {self.lora_coding_rate}")
-                    self.board_uart.send(b"set_rx\r\n")
+                    self.board_uart.send(
+                        bytes(lora_cmd_frequency + "set_rx\r\n", "utf-8")
+                    )
+                    self.logger.info("Bandwidth: %s", self.lora_bandwidth)
+                    self.logger.info("Channel: %s", self.lora_channel)
+                    self.logger.info("Frequency: %s", self.lora_frequency)
+                    self.logger.info("Spreading Factor: %s", self.lora_spreading_factor)
+                    self.logger.info("Coding Rate: %s", self.lora_coding_rate)
                 self.board_uart.set_serial_baudrate(115200)
 
+            # recv() blocks in read_until until a frame arrives, no need to
+            # sleep between reads
             while not self.sniffer_recv_cancel:
                 frame = self.board_uart.recv()
                 if frame is not None:
+                    # Stamp the frame on arrival, the PCAP record is built
+                    # later by the data handler
+                    timestamp_ns = time.time_ns()
                     packet_frame = self.dissector(frame)
                     if packet_frame:
-                        self.sniffer_data = packet_frame
-                time.sleep(0.01)
+                        self.sniffer_data_queue.put((timestamp_ns, packet_frame))
         except Exception as e:
             LOG_ERROR(e)
         finally:
@@ -3,6 +3,7 @@ import serial
 import serial.tools.list_ports
 import threading
 import sys
+from functools import lru_cache
 from .Definitions import START_OF_FRAME, END_OF_FRAME
 from .Utils import LOG_ERROR, LOG_WARNING
 
@@ -16,6 +17,8 @@ else:
 DEFAULT_SERIAL_BAUDRATE = 921600
 CATSNIFFER_VID = 11914
 CATSNIFFER_PID = 192
+# Frames are read up to the end of one frame and the start of the next
+FRAME_DELIMITER = END_OF_FRAME + START_OF_FRAME
 
 
 class UART(threading.Thread):
@@ -36,18 +39,24 @@ class UART(threading.Thread):
         return self.serial_worker.port
 
     def set_serial_port(self, serial_port: str):
-        self.serial_worker.port = serial_port
+        # pyserial closes and reopens an open port on every assignment
+        if self.serial_worker.port != serial_port:
+            self.serial_worker.port = serial_port
 
     def set_serial_baudrate(self, baudrate: int):
-        self.serial_worker.baudrate = baudrate
+        # pyserial reconfigures an open port on every assignment
+        if self.serial_worker.baudrate != baudrate:
+            self.serial_worker.baudrate = baudrate
 
     def set_is_catsniffer(self, board) -> int:
         self.is_catsniffer = board
 
     def is_valid_connection(self) -> bool:
         try:
-            self.open()
-            self.close()
+            # Keep the port open for the capture, reopening it would redo the
+            # termios setup and toggle DTR again
+            if not self.is_connected():
+                self.open()
             return True
         except serial.SerialException as e:
             LOG_ERROR(e)
@@ -60,8 +69,20 @@ class UART(threading.Thread):
 
     def open(self):
         self.serial_worker.open()
+        self.set_low_latency()
         self.reset_buffer()
 
+    def set_low_latency(self):
+        # Best effort: only POSIX pyserial exposes ASYNC_LOW_LATENCY, and not
+        # every USB-serial driver accepts it
+        set_low_latency_mode = getattr(self.serial_worker, "set_low_latency_mode", None)
+        if set_low_latency_mode is None:
+            return
+        try:
+            set_low_latency_mode(True)
+        except (ValueError, OSError, AttributeError):
+            pass
+
     def close(self):
         if self.serial_worker.is_open:
             self.reset_buffer()
@@ -76,15 +97,14 @@ class UART(threading.Thread):
 
     def recv_catsniffer(self):
         try:
-            bytestream = self.serial_worker.read_until((END_OF_FRAME + START_OF_FRAME))
-            sof_index = 0
-
-            eof_index = bytestream.find((END_OF_FRAME + START_OF_FRAME), sof_index)
-            if eof_index == -1:
-                LOG_WARNING(f"[UART] EOF - {eof_index} not found in {bytestream}")
+            bytestream = self.serial_worker.read_until(FRAME_DELIMITER)
+            # read_until stops right after the delimiter, so a complete frame
+            # always ends with it; anything else is a timeout
+            if not bytestream.endswith(FRAME_DELIMITER):
+                LOG_WARNING(f"[UART] EOF not found in {bytestream}")
                 return None
 
-            bytestream = START_OF_FRAME + bytestream[sof_index : eof_index + 2]
+            bytestream = START_OF_FRAME + bytestream[:-2]
             return bytestream
         except serial.SerialException as e:
             LOG_ERROR("Error reading from serial port")
@@ -93,10 +113,13 @@ class UART(threading.Thread):
     def recv_boards(self):
         try:
             bytestream = self.serial_worker.read_until(END_OF_FRAME)
-            filter_bytes = bytestream.replace(b"\n", b"").replace(b"\r", b"")
-            sof_index = filter_bytes.find(START_OF_FRAME)
-            if sof_index != -1:
-                filter_bytes = filter_bytes[sof_index:]
+            filter_bytes = bytestream.translate(None, b"\r\n")
+            # Frames are normally aligned, only scan and copy when there is
+            # leading garbage before the start of frame
+            if not filter_bytes.startswith(START_OF_FRAME):
+                sof_index = filter_bytes.find(START_OF_FRAME)
+                if sof_index != -1:
+                    filter_bytes = filter_bytes[sof_index:]
             return filter_bytes
         except serial.SerialException as e:
             LOG_ERROR("Error reading from serial port")
@@ -110,7 +133,9 @@ class UART(threading.Thread):
         else:
             return self.recv_boards()
 
-    def find_catsniffer_serial_port(self):
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def find_catsniffer_serial_port():
         ports = serial.tools.list_ports.comports()
         for port in ports:
             if port.vid == CATSNIFFER_VID and port.pid == CATSNIFFER_PID:
@@ -1,13 +1,25 @@
 import os
 import time
 import platform
-import re
+import string
 import uuid
 
+# Log prefixes
+LOG_PREFIX_INFO = "[INFO] "
+LOG_PREFIX_ERROR = "\x1b[31;1m[ERROR] "
+LOG_PREFIX_WARNING = "\x1b[33;1m[WARNING] "
+LOG_STYLE_RESET = "\x1b[0m"
+HEX_DIGITS = frozenset(string.hexdigits)
+
 
 def validate_access_address(access_address):
-    regex = re.compile(r"^(?:[0-9a-fA-F]{2}:){5}[0-9a-fA-F]{2}$|^[0-9a-fA-F]{12}$")
-    return bool(regex.match(access_address))
+    """Check for an address as "aa:bb:cc:dd:ee:ff" or "aabbccddeeff"."""
+    if len(access_address) == 17:
+        octets = access_address.split(":")
+        return len(octets) == 6 and all(
+            len(octet) == 2 and HEX_DIGITS.issuperset(octet) for octet in octets
+        )
+    return len(access_address) == 12 and HEX_DIGITS.issuperset(access_address)
 
 
 def clear_screen():
@@ -20,8 +32,7 @@ def clear_screen():
 
 def create_folders(path):
     """Function to create folders."""
-    if not os.path.exists(path):
-        os.makedirs(path)
+    os.makedirs(path, exist_ok=True)
 
 
 def generate_filename():
@@ -31,14 +42,14 @@ def generate_filename():
 
 def LOG_INFO(message):
     """Function to log information."""
-    print(f"[INFO] {message}")
+    print(f"{LOG_PREFIX_INFO}{message}")
 
 
 def LOG_ERROR(message):
     """Function to log error."""
-    print(f"\x1b[31;1m[ERROR] {message}\x1b[0m")
+    print(f"{LOG_PREFIX_ERROR}{message}{LOG_STYLE_RESET}")
 
 
 def LOG_WARNING(message):
     """Function to log warning."""
-    print(f"\x1b[33;1m[WARNING] {message}\x1b[0m")
+    print(f"{LOG_PREFIX_WARNING}{message}{LOG_STYLE_RESET}")
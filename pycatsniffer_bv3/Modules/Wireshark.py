@@ -1,10 +1,34 @@
+import os
+import shutil
 import threading
 import platform
 import subprocess
+from functools import lru_cache
 
 from .Fifo import DEFAULT_FILENAME
 from .Definitions import DEFAULT_TIMEOUT_JOIN
 
+SYSTEM = platform.system()
+WIRESHARK_PATHS = {
+    "Windows": "C:\\Program Files\\Wireshark\\Wireshark.exe",
+    "Linux": "/usr/bin/wireshark",
+    "Darwin": "/Applications/Wireshark.app/Contents/MacOS/Wireshark",
+}
+WIRESHARK_FIFO_PATHS = {
+    "Windows": "\\\\.\\pipe\\{}",
+    "Linux": "/tmp/{}",
+    "Darwin": "/tmp/{}",
+}
+
+
+@lru_cache(maxsize=None)
+def get_wireshark_path(system: str = SYSTEM) -> str:
+    """Return the Wireshark executable, falling back to the one on PATH."""
+    wireshark_path = WIRESHARK_PATHS.get(system)
+    if wireshark_path and os.path.exists(wireshark_path):
+        return wireshark_path
+    return shutil.which("wireshark") or wireshark_path
+
 
 class Wireshark(threading.Thread):
     def __init__(self, fifo_name: str = DEFAULT_FILENAME, profile: str = "default"):
@@ -14,46 +38,30 @@ class Wireshark(threading.Thread):
         self.type_worker = "wireshark"
         self.wireshark_process = None
         self.profile = profile
+        self.wireshark_cmd = self.get_wireshark_cmd()
 
-    def run(self):
-        if platform.system() == "Windows":
-            self.wireshark_process = subprocess.Popen(
-                [
-                    "C:\\Program Files\\Wireshark\\Wireshark.exe",
-                    "-k",
-                    "-i",
-                    f"\\\\.\\pipe\\{self.fifo_name}",
-                    "-C",
-                    self.profile,
-                ]
-            )
+    def get_wireshark_cmd(self) -> list:
+        fifo_path = WIRESHARK_FIFO_PATHS.get(SYSTEM)
+        if fifo_path is None:
+            return None
+        return [
+            get_wireshark_path(),
+            "-k",
+            "-i",
+            fifo_path.format(self.fifo_name),
+            "-C",
+            self.profile,
+        ]
 
-        elif platform.system() == "Linux":
-            self.wireshark_process = subprocess.Popen(
-                [
-                    # "sudo",
-                    "/usr/bin/wireshark",
-                    "-k",
-                    "-i",
-                    f"/tmp/{self.fifo_name}",
-                    "-C",
-                    self.profile,
-                ]
-            )
-        elif platform.system() == "Darwin":
-            self.wireshark_process = subprocess.Popen(
-                [
-                    "/Applications/Wireshark.app/Contents/MacOS/Wireshark",
-                    "-k",
-                    "-i",
-                    f"/tmp/{self.fifo_name}",
-                    "-C",
-                    self.profile,
-                ]
-            )
-        else:
+    def run(self):
+        if self.wireshark_cmd is None:
             print("Not supported OS")
             return
+        self.wireshark_process = subprocess.Popen(
+            self.wireshark_cmd,
+            stdin=subprocess.DEVNULL,
+            start_new_session=SYSTEM != "Windows",
+        )
         self.running = False
 
     def stop_thread(self):
@@ -22,8 +22,8 @@ class Worker(threading.Thread):
 
 
 class WorkerManager:
-    def __init__(self, modules=[]):
-        self.modules = modules
+    def __init__(self, modules=None):
+        self.modules = modules if modules is not None else []
         self.workers = []
         self.running = False
 
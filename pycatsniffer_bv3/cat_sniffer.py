@@ -14,7 +14,7 @@ except ImportError:
     )
     sys.exit(1)
 
-from Modules import HexDumper, PcapDumper, Protocols, Fifo, Wireshark, Cmd
+from Modules import HexDumper, PcapDumper, Protocols, Fifo, Wireshark, Cmd, UART
 import Modules.SnifferCollector as SCollector
 from Modules.Definitions import PROMPT_HEADER, DEFAULT_INIT_ADDRESS
 from Modules.Utils import validate_access_address
@@ -22,6 +22,14 @@ from Modules.Utils import validate_access_address
 HELP_PANEL_OUTPUT = "Output Options"
 BOARD_MODE = 1
 CATSNIFFER_LORA_MODE = 2
+CONSOLE = Console()
+
+
+def create_fifo_worker(fifo_name: str) -> Fifo.Fifo:
+    """Create the FIFO output worker for the current platform."""
+    if platform.system() == "Windows":
+        return Fifo.FifoWindows(fifo_name)
+    return Fifo.FifoLinux(fifo_name)
 
 
 class Catsniffer:
@@ -32,7 +40,7 @@ class Catsniffer:
     def start(
         self,
         comport: str = typer.Argument(
-            default=SCollector.SnifferCollector().board_uart.find_catsniffer_serial_port(),
+            default=UART.UART.find_catsniffer_serial_port(),
             help="The COM port to use.",
         ),
         phy: str = typer.Option(
@@ -54,7 +62,7 @@ class Catsniffer:
             rich_help_panel=HELP_PANEL_OUTPUT,
         ),
         dumpfile_name: str = typer.Option(
-            HexDumper.HexDumper().DEFAULT_FILENAME,
+            HexDumper.HexDumper.DEFAULT_FILENAME,
             "-dfn",
             "--dump-name",
             show_default=True,
@@ -70,7 +78,7 @@ class Catsniffer:
             rich_help_panel=HELP_PANEL_OUTPUT,
         ),
         pcapfile_name: str = typer.Option(
-            PcapDumper.PcapDumper().DEFAULT_FILENAME,
+            PcapDumper.PcapDumper.DEFAULT_FILENAME,
             "-pfn",
             "--pcap-name",
             show_default=True,
@@ -141,10 +149,7 @@ class Catsniffer:
             self.output_workers.append(PcapDumper.PcapDumper(pcapfile_name))
 
         if fifo or fifo_name != Fifo.DEFAULT_FILENAME:
-            if platform.system() == "Windows":
-                self.output_workers.append(Fifo.FifoWindows(fifo_name))
-            else:
-                self.output_workers.append(Fifo.FifoLinux(fifo_name))
+            self.output_workers.append(create_fifo_worker(fifo_name))
             if wireshark:
                 self.output_workers.append(
                     Wireshark.Wireshark(fifo_name, get_protocol.get_profile())
@@ -159,8 +164,7 @@ class Catsniffer:
         table_information.add_row("COM Port", comport)
         table_information.add_row("PHY", get_protocol.get_name())
         table_information.add_row("Channel", str(channel))
-        console = Console()
-        console.print(table_information)
+        CONSOLE.print(table_information)
 
         Cmd.CMDInterface(self.sniffer_collector).cmdloop()
 
@@ -185,9 +189,8 @@ class ProtocolsInformation:
                 str(proto.get_channel_range()),
                 proto.get_common_name_str(),
             )
-        console = Console()
-        console.print(table)
-        console.print(
+        CONSOLE.print(table)
+        CONSOLE.print(
             "*Phy Label: The PHY label is the name of the PHY protocol used in the sniffer. You can use this label to set the PHY protocol in the sniff command."
         )
 
@@ -200,7 +203,7 @@ class CatsnifferLora:
     def start(
         self,
         comport: str = typer.Argument(
-            default=SCollector.SnifferCollector().board_uart.find_catsniffer_serial_port(),
+            default=UART.UART.find_catsniffer_serial_port(),
             help="The COM port to use.",
         ),
         freq: float = typer.Option(
@@ -305,10 +308,7 @@ class CatsnifferLora:
         self.sniffer_collector.set_lora_spread_factor(spread_factor)
         self.sniffer_collector.set_lora_coding_rate(coding_rate)
         if fifo or fifo_name != Fifo.DEFAULT_FILENAME:
-            if platform.system() == "Windows":
-                self.output_workers.append(Fifo.FifoWindows(fifo_name))
-            else:
-                self.output_workers.append(Fifo.FifoLinux(fifo_name))
+            self.output_workers.append(create_fifo_worker(fifo_name))
             if wireshark:
                 self.output_workers.append(Wireshark.Wireshark(fifo_name))
 
@@ -349,7 +349,7 @@ class BoardsWireshark:
             rich_help_panel=HELP_PANEL_OUTPUT,
         ),
         dumpfile_name: str = typer.Option(
-            HexDumper.HexDumper().DEFAULT_FILENAME,
+            HexDumper.HexDumper.DEFAULT_FILENAME,
             "-dfn",
             "--dump-name",
             show_default=True,
@@ -365,7 +365,7 @@ class BoardsWireshark:
             rich_help_panel=HELP_PANEL_OUTPUT,
         ),
         pcapfile_name: str = typer.Option(
-            PcapDumper.PcapDumper().DEFAULT_FILENAME,
+            PcapDumper.PcapDumper.DEFAULT_FILENAME,
             "-pfn",
             "--pcap-name",
             show_default=True,
@@ -426,10 +426,7 @@ If you are running in Windows, you need first set the Environment Variable to ca
             self.output_workers.append(PcapDumper.PcapDumper(pcapfile_name))
 
         if fifo or fifo_name != Fifo.DEFAULT_FILENAME:
-            if platform.system() == "Windows":
-                self.output_workers.append(Fifo.FifoWindows(fifo_name))
-            else:
-                self.output_workers.append(Fifo.FifoLinux(fifo_name))
+            self.output_workers.append(create_fifo_worker(fifo_name))
             if wireshark:
                 self.output_workers.append(Wireshark.Wireshark(fifo_name))
 
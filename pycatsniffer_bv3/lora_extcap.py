@@ -11,18 +11,16 @@ import sys
 import os
 import os.path
 import argparse
-import re
 import threading
 import struct
 import logging
-import time
 import signal
 import traceback
-import Modules.SnifferCollector as SCollector
 from Modules import Fifo
-from serial.tools.list_ports import comports
 
 scriptName = os.path.basename(sys.argv[0])
+# Seconds between checks for a stop request while waiting on an event
+EVENT_WAIT_TIMEOUT = 0.5
 
 CTRL_NUM_LOGGER = 0
 CTRL_NUM_REGION = 1
@@ -41,11 +39,15 @@ CTRL_CMD_STATUSBAR = 6
 CTRL_CMD_INFORMATION = 7
 CTRL_CMD_WARNING = 8
 CTRL_CMD_ERROR = 9
+# Control message header: sync pipe "T", length (24 bits), control, command
+CTRL_MSG_HEADER = struct.Struct("!bBHBB")
 # Board and protocol
 CATSNIFFER_BOARD = 2
 CATSNIFFER_DLT = 148
 CATSNIFFER_VID = 11914
 CATSNIFFER_PID = 192
+# Windows extcap interfaces need the device namespace prefix
+SERIAL_DEVICE_PREFIX = "//./" if sys.platform == "win32" else ""
 
 
 class UsageError(Exception):
@@ -56,13 +58,15 @@ class SnifferExtcapPlugin:
     def __init__(self) -> None:
         self.args = None
         self.logger = None
-        self.hw = SCollector.SnifferCollector(logger=logging.getLogger("sniffer_hw"))
+        self.hw = None
         self.captureStream = None
         self.controlReadStream = None
         self.controlWriteStream = None
         self.controlThread = None
-        self.captureStopped = False
-        self.controlsInitialized = False
+        self.captureStopped = threading.Event()
+        self.controlsInitialized = threading.Event()
+        # Set by the signal handlers, the main thread does the actual stop
+        self.stopRequested = False
 
     def main(self, args=None):
         # initialize logging
@@ -314,6 +318,8 @@ class SnifferExtcapPlugin:
         )
 
     def extcap_config(self):
+        from serial.tools.list_ports import comports
+
         lines = []
         lines.append(
             "arg {number=0}{call=--serport}{type=selector}{required=true}"
@@ -350,10 +356,7 @@ class SnifferExtcapPlugin:
         )
         other_ports = []
         for port in comports():
-            if sys.platform == "win32":
-                device = f"//./{port.device}"
-            else:
-                device = port.device
+            device = SERIAL_DEVICE_PREFIX + port.device
             if port.vid is not None and port.pid is not None:
                 if port.vid == CATSNIFFER_VID and port.pid == CATSNIFFER_PID:
                     displayName = "%s - CatSniffer" % (port.device)
@@ -406,12 +409,13 @@ class SnifferExtcapPlugin:
         #    *after* the PcapBleWriter has been initialized to avoid a deadlock.
         if self.controlReadStream:
             self.logger.info("Waiting for INITIALIZED message from Wireshark")
-            while not self.controlsInitialized:
-                time.sleep(0.1)
+            while not self.controlsInitialized.wait(EVENT_WAIT_TIMEOUT):
+                pass
 
         self.logger.info("Initializing CatSniffer hardware interface")
 
         # initialize the CatSniffer hardware interface
+        self.init_hw()
         self.hw.set_board_uart(self.args.serport)
         self.hw.set_is_catsniffer(CATSNIFFER_BOARD)
         self.hw.set_lora_bandwidth(self.args.bandwidth)
@@ -424,8 +428,8 @@ class SnifferExtcapPlugin:
 
         # Arrange to exit gracefully on a signal from Wireshark. NOTE that this
         # has no effect under Windows.
-        signal.signal(signal.SIGINT, lambda sig, frame: self.stopCapture())
-        signal.signal(signal.SIGTERM, lambda sig, frame: self.stopCapture())
+        signal.signal(signal.SIGINT, lambda sig, frame: self.requestStop())
+        signal.signal(signal.SIGTERM, lambda sig, frame: self.requestStop())
         if self.args.fifo is not None:
             self.logger.info("Opening capture output FIFO")
             self.hw.set_output_workers([Fifo.FifoLinux(self.args.fifo)])
@@ -435,11 +439,12 @@ class SnifferExtcapPlugin:
             CTRL_CMD_SET, CTRL_NUM_BANDWIDTH, str(self.args.bandwidth)
         )
 
-        # capture packets and write to the capture output until signaled to stop
-        while not self.captureStopped:
-            # wait for a capture packet
-            time.sleep(0.1)
-            pass
+        # capture packets and write to the capture output until signaled to stop,
+        # waking up now and then so a signal is handled (and Ctrl+C works on
+        # Windows)
+        while not self.captureStopped.wait(EVENT_WAIT_TIMEOUT):
+            if self.stopRequested:
+                self.stopCapture()
 
         self.logger.info("Capture stopped")
 
@@ -458,6 +463,8 @@ class SnifferExtcapPlugin:
             self.controlReadStream = open(self.args.extcap_control_in, "rb", 0)
 
         if self.controlReadStream:
+            # the control thread drives the hardware, so it must exist first
+            self.init_hw()
             # start a thread to read control messages
             self.logger.info("Starting control thread")
             self.controlThread = threading.Thread(
@@ -465,8 +472,19 @@ class SnifferExtcapPlugin:
             )
             self.controlThread.start()
 
+    def init_hw(self):
+        # Imported here so the extcap-interfaces/dlts/config queries that
+        # Wireshark runs on startup do not load the serial capture stack
+        if self.hw is None:
+            import Modules.SnifferCollector as SCollector
+
+            self.hw = SCollector.SnifferCollector(
+                logger=logging.getLogger("sniffer_hw")
+            )
+        return self.hw
+
     def close_pipes(self):
-        if self.hw.sniffer_recv_cancel:
+        if self.hw and self.hw.sniffer_recv_cancel:
             self.hw.stop_workers()
             self.hw.delete_all_workers()
         if self.controlWriteStream is not None:
@@ -479,7 +497,7 @@ class SnifferExtcapPlugin:
                 (cmd, controlNum, payload) = self.readControlMessage()
                 self.logger.info("Control message received: %d %d" % (cmd, controlNum))
                 if cmd == CTRL_CMD_INITIALIZED:
-                    self.controlsInitialized = True
+                    self.controlsInitialized.set()
                 elif cmd == CTRL_CMD_SET and controlNum == CTRL_NUM_CHANNEL:
                     self.logger.info("Changing channel: %s" % payload)
                     self.args.channel = int(payload)
@@ -526,14 +544,14 @@ class SnifferExtcapPlugin:
 
     def readControlMessage(self):
         try:
-            header = self.controlReadStream.read(6)
+            header = self.controlReadStream.read(CTRL_MSG_HEADER.size)
         except (
             IOError
         ):  # Windows will raise this when the other end of the FIFO is closed
             raise EOFError()
-        if len(header) < 6:
+        if len(header) < CTRL_MSG_HEADER.size:
             raise EOFError()
-        (sp, msgLenH, msgLenL, controlNum, cmd) = struct.unpack("!bBHBB", header)
+        (sp, msgLenH, msgLenL, controlNum, cmd) = CTRL_MSG_HEADER.unpack(header)
         if sp != ord("T"):
             raise ValueError("Bad control message received")
         msgLen = (msgLenH << 16) | msgLenL
@@ -562,14 +580,21 @@ class SnifferExtcapPlugin:
         if len(payload) > 65535:
             raise ValueError("Control message payload too long")
         msgLen = len(payload) + 2
-        msg = bytearray()
-        msg += struct.pack(
-            "!bBHBB", ord("T"), msgLen >> 16, msgLen & 0xFFFF, controlNum, cmd
+        msg = (
+            CTRL_MSG_HEADER.pack(
+                ord("T"), msgLen >> 16, msgLen & 0xFFFF, controlNum, cmd
+            )
+            + payload
         )
-        msg += payload
-        print(msg)
+        if self.logger and self.logger.isEnabledFor(logging.DEBUG):
+            print(msg)
         self.controlWriteStream.write(msg)
 
+    def requestStop(self):
+        # Runs in a signal handler on the main thread, which may be inside an
+        # Event call already, so only flag the stop here
+        self.stopRequested = True
+
     def stopCapture(self):
         # interrupt the main thread if it is in the middle of receiving data
         # from the capture hardware.
@@ -577,7 +602,7 @@ class SnifferExtcapPlugin:
             self.hw.send_command_stop()
 
         # signal the main thread that capturing has been stopped
-        self.captureStopped = True
+        self.captureStopped.set()
 
 
 class SniffleExtcapLogHandler(logging.Handler):